@@ -1,63 +1,49 @@
-from enum import StrEnum
-
-class Card:
-    class Suit(StrEnum):
-        HEARTS = 'Hearts'
-        DIAMONDS = 'Diamonds'
-        CLUBS = 'Clubs'
-        SPADES = 'Spades'
-        
-    class Rank(StrEnum):
-        ACE = 'Ace'
-        TWO = '2'
-        THREE = '3'
-        FOUR = '4'
-        FIVE = '5'
-        SIX = '6'
-        SEVEN = '7'
-        EIGHT = '8'
-        NINE = '9'
-        TEN = '10'
-        JACK = 'Jack'
-        QUEEN = 'Queen'
-        KING = 'King'
-    
-    RANK_VALUES = {
-        'Ace': 14,
-        '2': 2,
-        '3': 3,
-        '4': 4,
-        '5': 5,
-        '6': 6,
-        '7': 7,
-        '8': 8,
-        '9': 9,
-        '10': 10,
-        'Jack': 11,
-        'Queen': 12,
-        'King': 13,
-    }
-    
-    
-    def __init__(self, rank: Rank, suit: Suit):
-        self.rank = rank
-        self.suit = suit
-        self.point_value = self.RANK_VALUES[rank]
-    
-    def __eq__(self, other):
-        if not isinstance(other, Card):
-            return NotImplemented
-        return self.rank == other.rank and self.suit == other.suit
-    
-    def __hash__(self):
-        return hash((self.rank, self.suit))
-        
-    def __str__(self):
-        return f"{self.rank} of {self.suit}" 
-    
-    
+from typing import NewType
+
+# A Card is a packed 8-bit int: bits 0-3 hold the rank (2..14, Ace high),
+# bits 4-5 hold the suit (0..3). Plain ints keep the scoring loops free of
+# attribute lookups and enum dispatch - rank and suit are one bitmask op away.
+Card = NewType('Card', int)
+
+RANK_MASK = 0xF
+SUIT_SHIFT = 4
+
+RANKS = tuple(range(2, 15))  # 2..14, Ace is 14
+SUITS = tuple(range(4))
+
+HEARTS, DIAMONDS, CLUBS, SPADES = SUITS
+
+SUIT_NAMES = ('Hearts', 'Diamonds', 'Clubs', 'Spades')
+
+# Indexed by rank value (2..14); slots 0 and 1 are unused padding.
+RANK_NAMES = (None, None, '2', '3', '4', '5', '6', '7', '8', '9', '10',
+              'Jack', 'Queen', 'King', 'Ace')
+
+
+def make_card(rank: int, suit: int) -> Card:
+    return Card((suit << SUIT_SHIFT) | rank)
+
+
+# The canonical 52-card universe, hearts 2 through spades Ace. Ints are
+# their own flyweights (CPython interns these small values), so this one
+# tuple serves every deck build and asset loop without fresh allocations.
+ALL_CARDS = tuple(make_card(rank, suit) for suit in SUITS for rank in RANKS)
+
+
+def rank_of(card: Card) -> int:
+    return card & RANK_MASK
+
+
+def suit_of(card: Card) -> int:
+    return card >> SUIT_SHIFT
+
+
+def card_str(card: Card) -> str:
+    return f"{RANK_NAMES[card & RANK_MASK]} of {SUIT_NAMES[card >> SUIT_SHIFT]}"
+
+
 if __name__ == "__main__":
-    for suit in Card.Suit:
-        for rank in Card.Rank:
-            card = Card(rank, suit)
-            print(card)
\ No newline at end of file
+    for suit in SUITS:
+        for rank in RANKS:
+            card = make_card(rank, suit)
+            print(card_str(card))
@@ -0,0 +1,173 @@
+"""Cactus Kev style 5-card hand evaluator.
+
+Each packed 8-bit Card is translated once into a 32-bit word:
+
+    bits 16-28: one-hot rank bitmap (bit 0 = deuce .. bit 12 = ace)
+    bits 12-15: one-hot suit
+    bits  8-11: rank index (0..12)
+    bits  0- 7: prime associated with the rank
+
+With that encoding a 5-card hand is ranked with a handful of int ops:
+OR the words and shift for the rank bitmap, AND the suit nibbles for
+flush detection, and multiply the primes for hands with repeated ranks.
+The lookup tables cover all 7462 distinct 5-card hand classes and are
+generated at import time (a few thousand dict entries, built in
+milliseconds) instead of being shipped as binary files.
+
+Ranks run from 1 (royal flush) to 7462 (7-5-4-3-2 offsuit): lower is
+better, matching the classic Cactus Kev convention.
+"""
+from itertools import combinations
+from typing import Sequence
+from poker_game.game.card import Card, SUIT_SHIFT
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# CK word for every packed card value, indexed directly by the card int.
+CK_CARDS = [0] * 64
+for _suit in range(4):
+    for _rank in range(2, 15):
+        _r = _rank - 2
+        CK_CARDS[(_suit << SUIT_SHIFT) | _rank] = (
+            (1 << (16 + _r)) | (1 << (12 + _suit)) | (_r << 8) | PRIMES[_r]
+        )
+
+# Hand-class boundaries on the 1..7462 scale (inclusive upper bounds).
+ROYAL_FLUSH_RANK = 1
+STRAIGHT_FLUSH_MAX = 10
+FOUR_OF_A_KIND_MAX = 166
+FULL_HOUSE_MAX = 322
+FLUSH_MAX = 1599
+STRAIGHT_MAX = 1609
+THREE_OF_A_KIND_MAX = 2467
+TWO_PAIR_MAX = 3325
+PAIR_MAX = 6185
+HIGH_CARD_MAX = 7462
+
+# 13-bit rank bitmaps of the ten straights, best (ace high) first; the
+# wheel (A-5) comes last and is the weakest straight.
+_STRAIGHT_MASKS = tuple((0x1F << (top - 4)) for top in range(12, 3, -1)) + (0x100F,)
+
+
+def _build_tables():
+    flushes = {}    # rank bitmap -> hand rank, all 5 cards one suit
+    unique5 = {}    # rank bitmap -> hand rank, 5 distinct ranks, no flush
+    products = {}   # prime product -> hand rank, hands with repeated ranks
+    rank = 1
+
+    # Straight flushes
+    for mask in _STRAIGHT_MASKS:
+        flushes[mask] = rank
+        rank += 1
+
+    # Four of a kind: quad rank then kicker, high to low
+    for quad in range(12, -1, -1):
+        for kicker in range(12, -1, -1):
+            if kicker != quad:
+                products[PRIMES[quad] ** 4 * PRIMES[kicker]] = rank
+                rank += 1
+
+    # Full house: trips rank then pair rank, high to low
+    for trips in range(12, -1, -1):
+        for pair in range(12, -1, -1):
+            if pair != trips:
+                products[PRIMES[trips] ** 3 * PRIMES[pair] ** 2] = rank
+                rank += 1
+
+    # For 5 distinct ranks, comparing hands card by card from the top is
+    # the same as comparing the rank bitmaps as plain integers.
+    distinct_masks = sorted(
+        (sum(1 << r for r in combo) for combo in combinations(range(13), 5)),
+        reverse=True,
+    )
+    non_straight_masks = [m for m in distinct_masks if m not in flushes]
+
+    # Flushes (non-straight)
+    for mask in non_straight_masks:
+        flushes[mask] = rank
+        rank += 1
+
+    # Straights
+    for mask in _STRAIGHT_MASKS:
+        unique5[mask] = rank
+        rank += 1
+
+    # Three of a kind: trips rank then the two kickers, high to low
+    for trips in range(12, -1, -1):
+        for k1 in range(12, -1, -1):
+            for k2 in range(k1 - 1, -1, -1):
+                if trips != k1 and trips != k2:
+                    products[PRIMES[trips] ** 3 * PRIMES[k1] * PRIMES[k2]] = rank
+                    rank += 1
+
+    # Two pair: high pair, low pair, kicker
+    for p1 in range(12, -1, -1):
+        for p2 in range(p1 - 1, -1, -1):
+            for kicker in range(12, -1, -1):
+                if kicker != p1 and kicker != p2:
+                    products[PRIMES[p1] ** 2 * PRIMES[p2] ** 2 * PRIMES[kicker]] = rank
+                    rank += 1
+
+    # One pair: pair rank then three kickers, high to low
+    for pair in range(12, -1, -1):
+        for k1 in range(12, -1, -1):
+            for k2 in range(k1 - 1, -1, -1):
+                for k3 in range(k2 - 1, -1, -1):
+                    if pair not in (k1, k2, k3):
+                        products[PRIMES[pair] ** 2 * PRIMES[k1] * PRIMES[k2] * PRIMES[k3]] = rank
+                        rank += 1
+
+    # High card
+    for mask in non_straight_masks:
+        unique5[mask] = rank
+        rank += 1
+
+    assert rank - 1 == HIGH_CARD_MAX
+    return flushes, unique5, products
+
+
+_FLUSHES, _UNIQUE5, _PRODUCTS = _build_tables()
+
+
+def eval5(c1: Card, c2: Card, c3: Card, c4: Card, c5: Card) -> int:
+    """Rank a 5-card hand of packed Card ints; 1 is best, 7462 is worst."""
+    w1 = CK_CARDS[c1]
+    w2 = CK_CARDS[c2]
+    w3 = CK_CARDS[c3]
+    w4 = CK_CARDS[c4]
+    w5 = CK_CARDS[c5]
+    bitmap = (w1 | w2 | w3 | w4 | w5) >> 16
+    if w1 & w2 & w3 & w4 & w5 & 0xF000:
+        return _FLUSHES[bitmap]
+    rank = _UNIQUE5.get(bitmap)
+    if rank is not None:  # only 5-distinct-rank bitmaps are in the table
+        return rank
+    return _PRODUCTS[(w1 & 0xFF) * (w2 & 0xFF) * (w3 & 0xFF) * (w4 & 0xFF) * (w5 & 0xFF)]
+
+
+def eval_best5(cards: Sequence[Card]) -> int:
+    """Rank the best 5-card hand from 5 or more packed Card ints."""
+    return min(eval5(*combo) for combo in combinations(cards, 5))
+
+
+def hand_class(rank: int) -> int:
+    """Map a 1..7462 hand rank to a hand-type value (1 HIGH_CARD .. 10 ROYAL_FLUSH)."""
+    if rank == ROYAL_FLUSH_RANK:
+        return 10
+    if rank <= STRAIGHT_FLUSH_MAX:
+        return 9
+    if rank <= FOUR_OF_A_KIND_MAX:
+        return 8
+    if rank <= FULL_HOUSE_MAX:
+        return 7
+    if rank <= FLUSH_MAX:
+        return 6
+    if rank <= STRAIGHT_MAX:
+        return 5
+    if rank <= THREE_OF_A_KIND_MAX:
+        return 4
+    if rank <= TWO_PAIR_MAX:
+        return 3
+    if rank <= PAIR_MAX:
+        return 2
+    return 1
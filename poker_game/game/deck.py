@@ -1,36 +1,61 @@
-import random
-from poker_game.game.card import Card
+import numpy as np
+from poker_game.game.card import ALL_CARDS, Card, card_str
 
 class Deck:
-    def __init__(self):
-        self.suits = Card.Suit
-        self.ranks = Card.Rank
-        self.cards: list[Card] = []
-        self.card_set: set[Card] = set()
+    """A 52-card deck stored as a NumPy int8 array.
+
+    The array itself is fixed-size; n_remaining points one past the last
+    undealt card, so dealing and returning cards are pointer moves instead
+    of list pops/appends. in_deck is indexed by the packed card value and
+    gives return_card its O(1) membership check.
+
+    Shuffling runs through numpy's PCG64 generator (C-level Fisher-Yates);
+    pass a seed for reproducible deals in Monte-Carlo runs and tests.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.cards = np.empty(52, dtype=np.int8)
+        self.in_deck = np.zeros(64, dtype=bool)  # indexed by packed card value
+        self.n_remaining = 0
         self.build()
-    
+
     def build(self):
-        self.cards = [Card(value, suit) for suit in self.suits for value in self.ranks]
-        self.card_set = set(self.cards)
-    
+        self.cards[:] = ALL_CARDS
+        self.in_deck[:] = False
+        self.in_deck[self.cards] = True
+        self.n_remaining = 52
+
+    def reset(self):
+        """Restore all 52 cards to the deck and shuffle in place.
+
+        Rebuilds the backing array rather than just rewinding n_remaining:
+        return_card overwrites dealt slots, so the array alone can hold
+        duplicates after mid-hand returns. The rebuild is a 52-byte copy.
+        """
+        self.build()
+        self.rng.shuffle(self.cards)
+
     def shuffle(self):
-        random.shuffle(self.cards)
-    
+        self.rng.shuffle(self.cards[:self.n_remaining])
+
     def deal(self):
-        if len(self.cards) > 0:
-            dealt_card = self.cards.pop()
-            self.card_set.remove(dealt_card)
+        if self.n_remaining > 0:
+            self.n_remaining -= 1
+            dealt_card = int(self.cards[self.n_remaining])
+            self.in_deck[dealt_card] = False
             return dealt_card
-        
+
     def return_card(self, card: Card) -> bool:
-        if card not in self.card_set:
-            self.cards.append(card)
-            self.card_set.add(card)
+        if not self.in_deck[card]:
+            self.cards[self.n_remaining] = card
+            self.n_remaining += 1
+            self.in_deck[card] = True
             return True
         else:
-            print(f"Warning: Card {card} is already in the deck")
+            print(f"Warning: Card {card_str(card)} is already in the deck")
             return False
-    
+
     def return_cards(self, cards: list[Card]):
         for card in cards:
             self.return_card(card)
@@ -1,6 +1,11 @@
+import logging
 from enum import Enum, auto
 from poker_game.game.deck import Deck
-from poker_game.game.hand_scorer import HandScore
+from poker_game.game.hand_scorer import hand_name
+from poker_game.game.ck_eval import hand_class
+from poker_game.game.seven_eval import evaluate7_cached
+
+logger = logging.getLogger(__name__)
 
 class GamePhase(Enum):
     PREFLOP = auto()
@@ -30,22 +35,15 @@ class PokerGame:
         
     def start_new_hand(self):
         """Initialize a new hand"""
-        # return all cards to the deck
-        self.deck.return_cards(self.burned_cards)
+        # restore the full deck in one go - no card-by-card returns
+        self.deck.reset()
         self.burned_cards = []
-        self.deck.return_cards(self.community_cards)
         self.community_cards = []
-        self.deck.return_cards(self.player_hand)
-        self.player_hand = []
-        self.deck.return_cards(self.computer_hand)
-        self.computer_hand = []
-        self.deck.shuffle()
-        
+
         # Deal two cards to each player
-        for _ in range(2):
-            self.player_hand.append(self.deck.deal())
-            self.computer_hand.append(self.deck.deal())
-            
+        self.player_hand = [self.deck.deal(), self.deck.deal()]
+        self.computer_hand = [self.deck.deal(), self.deck.deal()]
+
         self.game_phase = GamePhase.PREFLOP
         return True
         
@@ -96,21 +94,23 @@ class PokerGame:
         if self.game_phase != GamePhase.SHOWDOWN:
             return None
             
-        player_score = HandScore(self.player_hand + self.community_cards)
-        computer_score = HandScore(self.computer_hand + self.community_cards)
-        
-        print("player_score: ", player_score)
-        print("computer_score: ", computer_score)
-        
-        self.winner = "player" if player_score > computer_score else "computer"
-        self.winner_hand = player_score.hand_type if self.winner == "player" else computer_score.hand_type
-        
-        print("winner: ", self.winner)
-        print("winner_hand: ", self.winner_hand)
-        
-        if player_score > computer_score:
+        # Raw evaluator ranks (1 best .. 7462 worst); no HandScore objects
+        # needed just to pick a winner
+        player_rank = evaluate7_cached(self.player_hand + self.community_cards)
+        computer_rank = evaluate7_cached(self.computer_hand + self.community_cards)
+
+        logger.debug("player_rank: %s", player_rank)
+        logger.debug("computer_rank: %s", computer_rank)
+
+        self.winner = "player" if player_rank < computer_rank else "computer"
+        self.winner_hand = hand_name(hand_class(min(player_rank, computer_rank)))
+
+        logger.debug("winner: %s", self.winner)
+        logger.debug("winner_hand: %s", self.winner_hand)
+
+        if player_rank < computer_rank:
             return "player"
-        elif computer_score > player_score:
+        elif computer_rank < player_rank:
             return "computer"
         else:
             return "tie"
@@ -1,305 +1,359 @@
-from enum import IntEnum, auto
-from collections import Counter
-from typing import List
-from poker_game.game.card import Card
-
-class HandType(IntEnum):
-    HIGH_CARD = ("High Card", auto())
-    PAIR = ("Pair", auto())
-    TWO_PAIR = ("Two Pair", auto())
-    THREE_OF_A_KIND = ("Three of a Kind", auto())
-    STRAIGHT = ("Straight", auto())
-    FLUSH = ("Flush", auto())
-    FULL_HOUSE = ("Full House", auto())
-    FOUR_OF_A_KIND = ("Four of a Kind", auto())
-    STRAIGHT_FLUSH = ("Straight Flush", auto())
-    ROYAL_FLUSH = ("Royal Flush", auto())
-    
-    def __new__(cls, string_name, value):
-        obj = int.__new__(cls, value)
-        obj._value_ = value
-        obj.string_name = string_name
-        return obj
+from heapq import nlargest
+from typing import Iterator, List
+from poker_game.game.card import (
+    Card, RANK_MASK, SUIT_SHIFT, make_card, rank_of, card_str,
+    HEARTS, CLUBS, SPADES,
+)
+from poker_game.game.ck_eval import eval_best5, hand_class
+from poker_game.game.seven_eval import evaluate7_cached
+from poker_game.game.numba_eval import score7
+
+# Compiled kernel when numba is installed, otherwise the pure-Python table
+# lookup memoized on the suit-canonical hand key.
+_evaluate7 = score7 if score7 is not None else evaluate7_cached
+
+# Hand types as plain module-level ints, weakest to strongest, matching the
+# class values returned by ck_eval.hand_class. Plain ints skip the enum
+# machinery (__new__, value lookup) the scoring path would otherwise pay.
+(HIGH_CARD, PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE,
+ FOUR_OF_A_KIND, STRAIGHT_FLUSH, ROYAL_FLUSH) = range(1, 11)
+
+HAND_NAMES = ("High Card", "Pair", "Two Pair", "Three of a Kind", "Straight",
+              "Flush", "Full House", "Four of a Kind", "Straight Flush",
+              "Royal Flush")
+
+
+def hand_name(hand_type: int) -> str:
+    return HAND_NAMES[hand_type - 1]
 
-    def __str__(self):
-        return self.string_name
 
 class HandScore:
     """Class to score a poker hand, given 5 or more cards
-    
+
     Attributes:
         cards (List[Card]): 7 cards, not necessarily sorted
-        value_counts (Counter): Count of each card value
-        sorted_values_and_counts (List[Tuple[int, int]]): Sorted list of (value, count) tuples
-            sorted by value, highest to lowest
-        suited_cards (Dict[Card.Suit, List[Card]]): Cards grouped by suit
-        hand_type (HandType): The type of hand found
+        rank_counts (List[int]): Count of each card rank value, indexed by rank
+        sorted_values_and_counts (Iterator[Tuple[int, int]]): Stream of (value, count)
+            tuples ordered by value, highest to lowest
+        suited_cards (List[List[Card]]): Cards grouped by suit, indexed by suit
+        cards_by_rank (List[List[Card]]): Cards grouped by rank value, indexed by rank
+        hand_type (int): The type of hand found (HIGH_CARD..ROYAL_FLUSH)
         score (int): The score of the hand
         scoring_cards (List[Card]): The cards used to score the hand, in order of importance
-        
-        The "check_" methods are used (in descending order of hand type) to find
-        the highest scoring hand and return the cards used to score the hand.   
-        Each method returns a list of the "scoring" cards, which are the cards used
-        to score the hand, sorted by importance to the hand type. If the given
-        "check_" method doesn't find the hand type, it returns None, and the next
-        "check_" method is tried.
+
+        Scoring runs through the Cactus Kev table lookup in ck_eval: the best
+        of the 21 5-card combinations decides hand_type and score. The "check_"
+        methods only serve the display path (scoring_cards), which is computed
+        lazily on first access. Each "check_" method returns a list of the
+        "scoring" cards sorted by importance to the hand type, or None if the
+        hand type isn't present, in which case the next one is tried.
     """
-    
+
     def __init__(self, cards: List[Card]):
+        self.reset(cards)
+
+    def reset(self, cards: List[Card]) -> 'HandScore':
+        """Re-score this instance in place for a new set of cards.
+
+        Lets callers keep one HandScore alive across hands instead of
+        allocating a fresh one per showdown; __init__ routes through here
+        too. Returns self for chaining.
+        """
         self.cards = cards  # 7 cards, not necessarily sorted
-        self.value_counts = Counter([card.point_value for card in self.cards])
-        self.sorted_values_and_counts = sorted(self.value_counts.items(), key=lambda x: x[0], reverse=True)
-        self.suited_cards = {}
+        self.hand_type, self.score = self.score_hand()
+
+        # Rank/suit buckets only feed the check_* display path; the 7-card
+        # scoring fast path above never touches them, so build them lazily.
+        self._rank_counts = None
+        self._suit_counts = None
+        self._suited_cards = None
+        self._cards_by_rank = None
+        self._scoring_cards = None
+        return self
+
+    def _build_buckets(self):
+        self._rank_counts = [0] * 15
+        self._suit_counts = [0, 0, 0, 0]
+        self._suited_cards = [[], [], [], []]
+        self._cards_by_rank = [[] for _ in range(15)]
         for card in self.cards:
-            self.suited_cards.setdefault(card.suit, []).append(card)
-            
-        self.hand_type, self.score, self.scoring_cards = self.score_hand()
-        
-        
+            rank = card & RANK_MASK
+            suit = card >> SUIT_SHIFT
+            self._rank_counts[rank] += 1
+            self._suit_counts[suit] += 1
+            self._suited_cards[suit].append(card)
+            self._cards_by_rank[rank].append(card)
+
+    @property
+    def rank_counts(self) -> List[int]:
+        if self._rank_counts is None:
+            self._build_buckets()
+        return self._rank_counts
+
+    @property
+    def suit_counts(self) -> List[int]:
+        if self._suit_counts is None:
+            self._build_buckets()
+        return self._suit_counts
+
+    @property
+    def suited_cards(self) -> List[List[Card]]:
+        if self._suited_cards is None:
+            self._build_buckets()
+        return self._suited_cards
+
+    @property
+    def cards_by_rank(self) -> List[List[Card]]:
+        if self._cards_by_rank is None:
+            self._build_buckets()
+        return self._cards_by_rank
+
+    @property
+    def sorted_values_and_counts(self) -> Iterator[tuple[int, int]]:
+        """Stream (value, count) pairs highest value first.
+
+        A generator rather than a list: the check_* consumers usually stop
+        at the first matching count, so most pairs are never produced.
+        """
+        rank_counts = self.rank_counts
+        return ((value, rank_counts[value])
+                for value in range(14, 1, -1) if rank_counts[value])
+
+
     def __str__(self):
-        return f"{self.hand_type.name}: {self.score} - {', '.join(str(card) for card in self.scoring_cards)}"
-    
-    
+        return f"{hand_name(self.hand_type)}: {self.score} - {', '.join(card_str(card) for card in self.scoring_cards)}"
+
+
     def __repr__(self):
-        return f"HandScore(hand_type={self.hand_type.name}, score={self.score}, scoring_cards={self.scoring_cards})"
+        return f"HandScore(hand_type={hand_name(self.hand_type)}, score={self.score}, scoring_cards={self.scoring_cards})"
 
     def __lt__(self, other: 'HandScore'):
         return self.score < other.score
-    
 
-    def score_hand(self) -> tuple[HandType, int, List[Card]]:
-        """Score a poker hand using hole cards and community cards"""
+
+    def score_hand(self) -> tuple[int, int]:
+        """Score a poker hand using hole cards and community cards
+
+        The usual 7-card case is a single perfect-hash table lookup; other
+        hand sizes fall back to ranking every 5-card combination through the
+        Cactus Kev lookup. Ranks count down from 1 (best), so the score is
+        flipped onto an ascending scale to keep __lt__ comparisons natural.
+        """
+        if len(self.cards) == 7:
+            best = _evaluate7(self.cards)
+        else:
+            best = eval_best5(self.cards)
+        return hand_class(best), 7463 - best
+
+    @property
+    def scoring_cards(self) -> List[Card]:
+        if self._scoring_cards is None:
+            self._scoring_cards = self.find_scoring_cards()
+        return self._scoring_cards
+
+    def find_scoring_cards(self) -> List[Card]:
+        """Find the 5 cards that make up the hand, in order of importance"""
         # Check from highest to lowest possible hands
-        score = 0
         scoring_cards = []
-        if royal_flush := self.check_royal_flush():
-            hand_type = HandType.ROYAL_FLUSH
-            scoring_cards = royal_flush
-        elif straight_flush := self.check_straight_flush():
-            hand_type = HandType.STRAIGHT_FLUSH
+        # A royal flush is just a straight flush topped by the ace, so one
+        # check_straight_flush call covers both branches.
+        if straight_flush := self.check_straight_flush():
             scoring_cards = straight_flush
         elif four_kind := self.check_four_of_a_kind():
-            hand_type = HandType.FOUR_OF_A_KIND
             scoring_cards = four_kind
         elif full_house := self.check_full_house():
-            hand_type = HandType.FULL_HOUSE
             scoring_cards = full_house
         elif flush := self.check_flush():
-            hand_type = HandType.FLUSH
             scoring_cards = flush
         elif straight := self.check_straight():
-            hand_type = HandType.STRAIGHT
             scoring_cards = straight
         elif three_kind := self.check_three_of_a_kind():
-            hand_type = HandType.THREE_OF_A_KIND
             scoring_cards = three_kind
         elif two_pair := self.check_two_pair():
-            hand_type = HandType.TWO_PAIR
             scoring_cards = two_pair
         elif pair := self.check_pair():
-            hand_type = HandType.PAIR
             scoring_cards = pair
         else:
-            hand_type = HandType.HIGH_CARD
-            scoring_cards = sorted(self.cards, key=lambda x: x.point_value, reverse=True)[:5]
-            
-        weights = reversed([16 ** i for i in range(len(scoring_cards))])
-        
-        # Score is 
-        score = sum(card.point_value * weight for card, weight in zip(scoring_cards, weights))
-        score += hand_type.value * 16 ** len(scoring_cards)
-        
-        return hand_type, score, scoring_cards
-
-    def check_royal_flush(self) -> List[Card] | None:
-        if straight_flush := self.check_straight_flush():
-            if straight_flush[0].point_value == 14 and straight_flush[-1].point_value == 10:  # Ace high, 10 low
-                return straight_flush
-        return None
+            scoring_cards = nlargest(5, self.cards, key=rank_of)
+
+        return scoring_cards
 
     def check_straight_flush(self) -> List[Card] | None:
         """Check for a straight flush amongs the 7 cards
-        
+
         uses check_straight to find the highest scoring straight flush,
         checking through each suit to find the highest scoring straight flush
         It can return the first found straight flush, as check_straight returns
         the highest scoring straight, and only one suit can possibly have a flush
-        
+
         """
-        for suit_cards in self.suited_cards.values():
-            if len(suit_cards) >= 5:
-                if straight := self.check_straight(suit_cards):
-                    return straight
+        for suit in range(4):
+            if self.suit_counts[suit] >= 5:
+                return self.check_straight(self.suited_cards[suit])
         return None
 
 
     def check_four_of_a_kind(self) -> List[Card] | None:
         """Check for four of a kind.
-        
+
         Returns:
             List[Card]: 5 cards in order: four matching cards followed by the highest kicker,
             or None if no four of a kind is found.
         """
-        for value, count in self.sorted_values_and_counts:
-            if count == 4:
-                quads = [card for card in self.cards if card.point_value == value]
-                kickers = sorted([card for card in self.cards if card.point_value != value], key=lambda x: x.point_value, reverse=True)[:1]
-                return quads + kickers   
+        rank_counts = self.rank_counts
+        for value in range(14, 1, -1):
+            if rank_counts[value] == 4:
+                quads = self.cards_by_rank[value]
+                kickers = nlargest(1, (card for card in self.cards if card & RANK_MASK != value), key=rank_of)
+                return quads + kickers
         return None
 
     def check_full_house(self) -> List[Card] | None:
         """Check for a full house.
-        
+
         Returns:
             List[Card]: 5 cards in order: three matching cards followed by two matching cards
             (highest possible combination), or None if no full house is found.
         """
+        rank_counts = self.rank_counts
+
         # Find highest three of a kind
         triple_value = None
-        for value, count in self.sorted_values_and_counts:
-            if count >= 3:
+        for value in range(14, 1, -1):
+            if rank_counts[value] >= 3:
                 triple_value = value
                 break
-        
+
         if triple_value is None:
             return None
-        
+
         # Find highest pair from remaining values
         pair_value = None
-        for value, count in self.sorted_values_and_counts:
-            if value != triple_value and count >= 2:
+        for value in range(14, 1, -1):
+            if value != triple_value and rank_counts[value] >= 2:
                 pair_value = value
                 break
         if pair_value is None:
             return None
-            
-        triple_cards = [card for card in self.cards if card.point_value == triple_value][:3]
-        pair_cards = [card for card in self.cards if card.point_value == pair_value][:2]
-        return triple_cards + pair_cards
+
+        return self.cards_by_rank[triple_value][:3] + self.cards_by_rank[pair_value][:2]
 
 
     def check_flush(self) -> List[Card] | None:
         """Check for a flush amongs the 7 cards"""
 
-        for suit_cards in self.suited_cards.values():
-            if len(suit_cards) >= 5:
-                return sorted(suit_cards, key=lambda x: x.point_value, reverse=True)[:5]
+        for suit in range(4):
+            if self.suit_counts[suit] >= 5:
+                return nlargest(5, self.suited_cards[suit], key=rank_of)
         return None
 
     def check_straight(self, card_subset: List[Card] | None = None) -> List[Card] | None:
-        """Check for a straight amongst 5 or more cards"""
-        # Sort cards by value
+        """Check for a straight amongst 5 or more cards
+
+        Works on a 15-bit rank bitmap: 5 consecutive set bits make a
+        straight, tested highest top card first so the best straight wins.
+        The Ace bit is folded down to position 1 so the wheel (A-5) falls
+        out of the same test.
+        """
         if card_subset is None:
             card_subset = self.cards
-        
-        sorted_cards = sorted(card_subset, key=lambda x: x.point_value, reverse=True)
-        all_point_values = set([card.point_value for card in sorted_cards])
-        # Check for a straight in reverse order to return highest scoring straight:
-        
-        for i in range(len(sorted_cards) - 4):
-            # current card would be highest in straight
-            if sorted_cards[i].point_value >= 5:
-                needed_values = set(range(sorted_cards[i].point_value, sorted_cards[i].point_value - 5, -1))
-                # check to see if needed values are in all_point_values
-                if needed_values.issubset(all_point_values):
-                    # build list of cards for straight
-                    straight_cards = []
-                    for value in needed_values:
-                        for card in sorted_cards:
-                            if card.point_value == value:
-                                straight_cards.append(card)
-                                break
-                    return sorted(straight_cards, key=lambda x: x.point_value, reverse=True)
-            
-        # Check for low ace straight
-        needed_values = set([14, 2, 3, 4, 5])
-        
-        if needed_values.issubset(all_point_values):
-            # build list of cards for straight
-            straight_cards = []
-            for value in needed_values:
-                for card in sorted_cards:
-                    if card.point_value == value:
-                        straight_cards.append(card)
-                        break
-            result = sorted(straight_cards, key=lambda x: x.point_value, reverse=True)
-            # place ace at the end of the list, since it's the lowest value in this straight
-            result.append(result.pop(0))
-            return result
-        
-        return None
+
+        mask = 0
+        for card in card_subset:
+            mask |= 1 << (card & RANK_MASK)
+        mask |= (mask >> 13) & 2  # Ace also plays low for the wheel
+
+        # Branchless run-of-5 test: a set bit in m5 marks the bottom of a
+        # 5-long run, so the highest set bit gives the best straight's top.
+        m5 = mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4)
+        if not m5:
+            return None
+
+        top = m5.bit_length() + 3
+        # build list of cards for the straight, highest first;
+        # in the wheel, value 1 is the Ace playing low
+        straight_cards = []
+        for value in range(top, top - 5, -1):
+            rank = 14 if value == 1 else value
+            for card in card_subset:
+                if card & RANK_MASK == rank:
+                    straight_cards.append(card)
+                    break
+        return straight_cards
 
     def check_three_of_a_kind(self) -> List[Card] | None:
         """Check for three of a kind.
-        
+
         Returns:
             List[Card]: 5 cards in order: three matching cards followed by the highest two kickers,
             or None if no three of a kind is found.
         """
-        for value, count in self.sorted_values_and_counts:
-            if count == 3:
-                three_cards = [card for card in self.cards if card.point_value == value][:3]
-                kickers = sorted([card for card in self.cards if card.point_value != value], key=lambda x: x.point_value, reverse=True)[:2]
-                return three_cards + kickers
+        rank_counts = self.rank_counts
+        for value in range(14, 1, -1):
+            if rank_counts[value] == 3:
+                kickers = nlargest(2, (card for card in self.cards if card & RANK_MASK != value), key=rank_of)
+                return self.cards_by_rank[value] + kickers
         return None
 
 
     def check_two_pair(self) -> List[Card] | None:
         """Check for two pair.
-    
+
         Returns:
             List[Card]: 5 cards in order: two pairs of matching cards followed by the highest kicker,
             or None if no two pair is found.
         """
-        pairs = []
-        for value, count in self.sorted_values_and_counts:
-            if count >= 2:
-                pairs.append([card for card in self.cards if card.point_value == value][:2])
-        if len(pairs) >= 2:
-            kickers = [card for card in self.cards if card not in pairs[0] and card not in pairs[1]]
-            highest_kicker = sorted(kickers, key=lambda x: x.point_value, reverse=True)[:1]
-            return pairs[0] + pairs[1] + highest_kicker
-        return None 
+        rank_counts = self.rank_counts
+        pair_ranks = [value for value in range(14, 1, -1) if rank_counts[value] >= 2]
+        if len(pair_ranks) >= 2:
+            high, low = pair_ranks[0], pair_ranks[1]
+            # Kicker: highest remaining rank, straight off the rank buckets -
+            # no per-card containment scans over the pair lists.
+            for value in range(14, 1, -1):
+                if rank_counts[value] and value != high and value != low:
+                    return (self.cards_by_rank[high][:2] + self.cards_by_rank[low][:2]
+                            + [self.cards_by_rank[value][0]])
+        return None
 
     def check_pair(self) -> List[Card] | None:
         """Check for a pair.
-    
+
         Returns:
             List[Card]: 5 cards in order: two matching cards followed by the highest three kickers,
             or None if no pair is found.
         """
-        for value, count in self.sorted_values_and_counts:
-            if count == 2:
-                pair_cards = [card for card in self.cards if card.point_value == value][:2]
-                kickers = [card for card in self.cards if card.point_value != value]
-                return pair_cards + sorted(kickers, key=lambda x: x.point_value, reverse=True)[:3]
-        return None 
+        rank_counts = self.rank_counts
+        for value in range(14, 1, -1):
+            if rank_counts[value] == 2:
+                kickers = nlargest(3, (card for card in self.cards if card & RANK_MASK != value), key=rank_of)
+                return self.cards_by_rank[value] + kickers
+        return None
 
 
 if __name__ == "__main__":
     player_cards = [
-        Card(Card.Rank.ACE, Card.Suit.SPADES),
-        Card(Card.Rank.TWO, Card.Suit.HEARTS),
+        make_card(14, SPADES),
+        make_card(2, HEARTS),
     ]
-    
+
     community_cards = [
-        Card(Card.Rank.THREE, Card.Suit.SPADES),
-        Card(Card.Rank.FOUR, Card.Suit.CLUBS),
-        Card(Card.Rank.FIVE, Card.Suit.HEARTS),
-        Card(Card.Rank.ACE, Card.Suit.CLUBS),
-        Card(Card.Rank.THREE, Card.Suit.HEARTS),
+        make_card(3, SPADES),
+        make_card(4, CLUBS),
+        make_card(5, HEARTS),
+        make_card(14, CLUBS),
+        make_card(3, HEARTS),
     ]
-    
+
     computer_cards = [
-        Card(Card.Rank.SIX, Card.Suit.SPADES),
-        Card(Card.Rank.SEVEN, Card.Suit.HEARTS),
+        make_card(6, SPADES),
+        make_card(7, HEARTS),
     ]
     player_total_cards = player_cards + community_cards
     computer_total_cards = computer_cards + community_cards
     player_hand = HandScore(player_total_cards)
     computer_hand = HandScore(computer_total_cards)
-    
+
     print("player_hand:", player_hand)
     print("computer_hand:", computer_hand)
-    
-    print(f"winner: {player_hand if player_hand > computer_hand else computer_hand}")
\ No newline at end of file
+
+    print(f"winner: {player_hand if player_hand > computer_hand else computer_hand}")
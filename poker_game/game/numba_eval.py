@@ -0,0 +1,47 @@
+"""Optional Numba-compiled 7-card scoring kernel.
+
+Runs the same flush-mask / perfect-hash lookup as seven_eval.evaluate7,
+but as an LLVM-compiled loop over a uint8 card array, skipping Python
+bytecode dispatch entirely. Numba is an optional dependency: when it is
+not installed, score7 is None and callers keep using the pure-Python
+lookup path.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is None:
+    score7 = None
+else:
+    from poker_game.game.seven_eval import _FLUSH_ARR, _NOFLUSH_KEYS, _NOFLUSH_VALS
+
+    # Materialize the mmap-backed tables so the kernel gets contiguous arrays.
+    _FLUSH = np.ascontiguousarray(_FLUSH_ARR)
+    _KEYS = np.ascontiguousarray(_NOFLUSH_KEYS)
+    _VALS = np.ascontiguousarray(_NOFLUSH_VALS)
+    _POW5 = np.array([5 ** i for i in range(13)], dtype=np.uint32)
+
+    @njit(cache=True, boundscheck=False)
+    def _score7_kernel(cards, flush_table, keys, vals, pow5):
+        suit_masks = np.zeros(4, np.int64)
+        suit_counts = np.zeros(4, np.int8)
+        key = np.uint32(0)
+        for i in range(7):
+            c = cards[i]
+            r = (c & 0xF) - 2
+            s = c >> 4
+            suit_masks[s] |= 1 << r
+            suit_counts[s] += 1
+            key += pow5[r]
+        for s in range(4):
+            if suit_counts[s] >= 5:
+                return flush_table[suit_masks[s]]
+        return vals[np.searchsorted(keys, key)]
+
+    def score7(cards) -> int:
+        """Rank 7 packed Card ints via the compiled kernel; 1 best, 7462 worst."""
+        arr = np.asarray(cards, dtype=np.uint8)
+        return int(_score7_kernel(arr, _FLUSH, _KEYS, _VALS, _POW5))
@@ -0,0 +1,142 @@
+"""Perfect-hash 7-card hand evaluator.
+
+Evaluates a full 7-card Texas Hold'em hand with a single table lookup
+instead of ranking all 21 five-card combinations. Tables live in
+poker_game/game/tables (regenerate with tools/gen_ph_tables.py) and use
+the Cactus Kev 1..7462 scale: lower is better.
+
+The non-flush key is a perfect hash of the rank multiset: rank counts in
+a 7-card hand never reach 5, so sum(count[r] * 5**r) is collision-free.
+When a suit holds 5+ cards the flush table is indexed directly by that
+suit's 13-bit rank mask - with only two off-suit cards, no quads or full
+house can outrank the flush, so the flush value is final.
+"""
+import os
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+from poker_game.game.card import Card, RANK_MASK, SUIT_SHIFT
+
+_TABLE_DIR = os.path.join(os.path.dirname(__file__), 'tables')
+
+# mmap keeps the arrays shareable/lazy; the scalar path reads through
+# plain Python lists to skip per-lookup numpy scalar boxing.
+_FLUSH_ARR = np.load(os.path.join(_TABLE_DIR, 'flush7.npy'), mmap_mode='r')
+_NOFLUSH_KEYS = np.load(os.path.join(_TABLE_DIR, 'noflush7_keys.npy'), mmap_mode='r')
+_NOFLUSH_VALS = np.load(os.path.join(_TABLE_DIR, 'noflush7_vals.npy'), mmap_mode='r')
+
+_FLUSH_TABLE = _FLUSH_ARR.tolist()
+_NOFLUSH_TABLE = dict(zip(_NOFLUSH_KEYS.tolist(), _NOFLUSH_VALS.tolist()))
+
+# Per-card contributions, indexed directly by the packed card int.
+_CARD_KEY = [0] * 64   # 5**rank_index, summed to form the non-flush hash
+_CARD_BIT = [0] * 64   # 1 << rank_index, OR-ed to form a suit's rank mask
+for _suit in range(4):
+    for _rank in range(2, 15):
+        _card = (_suit << SUIT_SHIFT) | _rank
+        _CARD_KEY[_card] = 5 ** (_rank - 2)
+        _CARD_BIT[_card] = 1 << (_rank - 2)
+
+
+def evaluate7(cards: Sequence[Card]) -> int:
+    """Rank 7 packed Card ints; 1 is best (royal flush), 7462 worst."""
+    s0 = s1 = s2 = s3 = 0
+    for c in cards:
+        suit = c >> SUIT_SHIFT
+        bit = _CARD_BIT[c]
+        if suit == 0:
+            s0 |= bit
+        elif suit == 1:
+            s1 |= bit
+        elif suit == 2:
+            s2 |= bit
+        else:
+            s3 |= bit
+    for mask in (s0, s1, s2, s3):
+        if mask.bit_count() >= 5:
+            return _FLUSH_TABLE[mask]
+    return _NOFLUSH_TABLE[
+        _CARD_KEY[cards[0]] + _CARD_KEY[cards[1]] + _CARD_KEY[cards[2]]
+        + _CARD_KEY[cards[3]] + _CARD_KEY[cards[4]] + _CARD_KEY[cards[5]]
+        + _CARD_KEY[cards[6]]
+    ]
+
+
+_POW5_BY_RANK = np.array([5 ** i for i in range(13)], dtype=np.int64)
+
+
+def evaluate7_batch(cards: np.ndarray) -> np.ndarray:
+    """Rank N 7-card hands at once.
+
+    Takes an (N, 7) array of packed card ints and returns uint16 ranks on
+    the same 1..7462 scale as evaluate7. All work is vectorized: per-suit
+    masked ORs for flush detection, then one searchsorted into the sorted
+    perfect-hash keys for the non-flush rows.
+    """
+    cards = np.asarray(cards)
+    n = len(cards)
+    ranks = (cards & RANK_MASK) - 2
+    suits = cards >> SUIT_SHIFT
+    bits = 1 << ranks.astype(np.int32)  # widen first: int8 shifts overflow
+
+    suit_masks = np.zeros((n, 4), dtype=np.int32)
+    suit_counts = np.zeros((n, 4), dtype=np.int8)
+    for suit in range(4):
+        in_suit = suits == suit
+        suit_masks[:, suit] = np.bitwise_or.reduce(np.where(in_suit, bits, 0), axis=1)
+        suit_counts[:, suit] = in_suit.sum(axis=1)
+
+    keys = _POW5_BY_RANK[ranks].sum(axis=1)
+    out = np.asarray(_NOFLUSH_VALS)[np.searchsorted(_NOFLUSH_KEYS, keys)]
+
+    flushy = suit_counts >= 5
+    has_flush = flushy.any(axis=1)
+    if has_flush.any():
+        flush_suit = np.argmax(flushy, axis=1)
+        flush_masks = suit_masks[np.arange(n), flush_suit]
+        out[has_flush] = np.asarray(_FLUSH_ARR)[flush_masks[has_flush]]
+    return out
+
+
+def canonical_key(cards: Sequence[Card]) -> int:
+    """Pack 7 cards into a 52-bit key invariant under suit permutation.
+
+    A hand is fully described by the rank set each suit holds, so sorting
+    the four 13-bit suit masks makes suit-isomorphic hands - which score
+    identically - collide on the same key. Monte-Carlo equity loops redraw
+    the same hand under different suits constantly, so this is what lets
+    the cache below actually hit.
+    """
+    s0 = s1 = s2 = s3 = 0
+    for c in cards:
+        suit = c >> SUIT_SHIFT
+        bit = _CARD_BIT[c]
+        if suit == 0:
+            s0 |= bit
+        elif suit == 1:
+            s1 |= bit
+        elif suit == 2:
+            s2 |= bit
+        else:
+            s3 |= bit
+    m0, m1, m2, m3 = sorted((s0, s1, s2, s3), reverse=True)
+    return (m0 << 39) | (m1 << 26) | (m2 << 13) | m3
+
+
+@lru_cache(maxsize=1 << 20)
+def _evaluate7_key(key: int) -> int:
+    cards = []
+    for suit in range(4):
+        mask = (key >> (39 - 13 * suit)) & 0x1FFF
+        while mask:
+            low = mask & -mask
+            cards.append((suit << SUIT_SHIFT) | (low.bit_length() + 1))
+            mask ^= low
+    return evaluate7(cards)
+
+
+def evaluate7_cached(cards: Sequence[Card]) -> int:
+    """evaluate7 memoized on the suit-canonical key of the 7 cards."""
+    return _evaluate7_key(canonical_key(cards))
@@ -1,15 +1,71 @@
+import logging
 import tkinter as tk
 from tkinter import ttk
 from PIL import Image, ImageTk
 import os
 from poker_game.game.game_logic import PokerGame, GamePhase
-from poker_game.game.card import Card
+from poker_game.game.card import RANKS, SUITS, RANK_NAMES, SUIT_NAMES, make_card
 from cairosvg import svg2png
+try:
+    import resvg_py
+except ImportError:
+    resvg_py = None
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
+import functools
+import hashlib
 import io
 
+logger = logging.getLogger(__name__)
+
 POKER_TABLE_GREEN = '#2C8B38'
 DEFAULT_FONT = ('Arial', 35)
 CARD_WIDTH = 175
+CARD_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'mtl_poker_ai', 'cards')
+
+@functools.lru_cache(maxsize=None)
+def rasterize_image(path, width, height):
+    """Render an SVG to PNG bytes at exact dimensions (safe off the main thread)
+
+    Memoized in-process, so repeat requests during resizes are dict hits.
+    On a miss, results come from (in order): PNGs pre-rasterized at build
+    time (tools/rasterize_assets.py), the on-disk user cache keyed by path,
+    mtime and target size, and finally cairo - whose output is written back
+    to the user cache so later launches skip rasterizing.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    prebuilt = os.path.join(os.path.dirname(path), 'png', f'{stem}_{width}.png')
+    try:
+        with open(prebuilt, 'rb') as f:
+            return f.read()
+    except OSError:
+        pass
+
+    key = hashlib.blake2b(f"{path}:{os.path.getmtime(path)}:{width}:{height}".encode()).hexdigest()
+    cache_path = os.path.join(CARD_CACHE_DIR, f"{key}.png")
+    try:
+        with open(cache_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        pass
+
+    # resvg (Rust, install the fast-svg extra) rasterizes several times
+    # faster than cairosvg; both release the GIL
+    if resvg_py is not None:
+        png_data = bytes(resvg_py.svg_to_bytes(svg_path=path, width=width, height=height))
+    else:
+        png_data = svg2png(url=path, output_width=width, output_height=height)
+
+    # Best-effort write - a read-only home dir just means no cache
+    try:
+        os.makedirs(CARD_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            f.write(png_data)
+    except OSError:
+        pass
+    return png_data
+
+
 class GameWindow:
     def __init__(self, root):
         self.root = root
@@ -22,8 +78,9 @@ class GameWindow:
         # Initialize game logic
         self.game = PokerGame()
         
-        # Load card images
-        self.card_images: dict[Card, ImageTk.PhotoImage] = {}
+        # Load card images; indexed by the packed card value, like the
+        # other per-card tables (deck.in_deck, seven_eval._CARD_KEY)
+        self.card_images: list[ImageTk.PhotoImage | None] = [None] * 64
         self.load_card_images()
         
         # Setup GUI
@@ -32,6 +89,11 @@ class GameWindow:
         
         # Add bindings for window resize
         self.resize_timer = None
+        self._last_size = (0, 0)
+        self._pending_size = (0, 0)
+        # Last-drawn (frame width, cards, face_up) per card row, so
+        # update_display can skip rows that have not changed
+        self._display_state = {}
         self.root.bind('<Configure>', self.on_window_resize)
         
         # Initialize card positions
@@ -119,39 +181,91 @@ class GameWindow:
     def load_card_images(self):
         """Load all card images"""
         card_width = CARD_WIDTH
-        images_dir = os.path.join(os.path.dirname(__file__), '..', 'assets')
-        print(f"Loading cards from: {images_dir}")  # Debug print
+        # Resolve through importlib.resources so installed wheels find the
+        # packaged assets; setuptools installs as a real directory, which the
+        # path-keyed PNG caches rely on.
+        images_dir = os.fspath(files('poker_game') / 'assets')
+        logger.debug("Loading cards from: %s", images_dir)
         
         # Pre-calculate output size for all cards
         aspect_ratio = 1.4  # Standard poker card ratio
         output_height = int(card_width * aspect_ratio)
         
-        # Load card back
+        # One directory scan instead of a stat call per card
+        with os.scandir(images_dir) as it:
+            present = {entry.name for entry in it if entry.is_file()}
+
+        # Collect every SVG to load up front: the card back plus the 52 faces
+        paths = {}
         back_path = os.path.join(images_dir, 'back.svg')
-        if os.path.exists(back_path):
-            print(f"Loading card back from: {back_path}")  # Debug print
-            self.card_back = self.load_and_resize_image(back_path, card_width, output_height)
+        if 'back.svg' in present:
+            logger.debug("Loading card back from: %s", back_path)
+            paths[None] = back_path
         else:
-            print(f"Card back not found at: {back_path}")  # Debug print
-        
-        # Load all card faces in a single batch
-        for suit in Card.Suit:
-            for rank in Card.Rank:
-                card = Card(rank, suit)
-                card_path = os.path.join(images_dir, f'{suit.value.lower()}_{rank.value.lower()}.svg')
-                if os.path.exists(card_path):
-                    self.card_images[card] = self.load_and_resize_image(card_path, card_width, output_height)
+            logger.warning("Card back not found at: %s", back_path)
+
+        for suit in SUITS:
+            for rank in RANKS:
+                card = make_card(rank, suit)
+                filename = f'{SUIT_NAMES[suit].lower()}_{RANK_NAMES[rank].lower()}.svg'
+                if filename in present:
+                    paths[card] = os.path.join(images_dir, filename)
                 else:
-                    print(f"Card not found: {card_path}")  # Debug print
+                    logger.warning("Card not found: %s", filename)
 
-    def load_and_resize_image(self, path, width, height):
-        """Load and resize an SVG image with pre-calculated dimensions"""
-        # Convert SVG to PNG in memory with exact dimensions
-        png_data = svg2png(url=path, output_width=width, output_height=height)
-        
-        # Create PIL Image from PNG data without additional resizing
-        image = Image.open(io.BytesIO(png_data))
-        return ImageTk.PhotoImage(image)
+        # Rasterize on worker threads - cairo releases the GIL, so this scales
+        # with cores - but don't block the window on the results: store the
+        # futures and let _get_card_image build each PhotoImage the first
+        # time a card is actually shown. Tk objects must only be created on
+        # the main thread, so only the byte-producing stage runs on workers.
+        pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._image_futures = {card: pool.submit(rasterize_image, path, card_width, output_height)
+                               for card, path in paths.items()}
+        pool.shutdown(wait=False)
+
+        # Decoded PIL images (kept for C-level LANCZOS resizing) and
+        # PhotoImages derived at non-native sizes
+        self._pil_images = {}
+        self._sized_photos = {}
+
+        # Only the back is needed before any cards are dealt
+        pil = self._get_pil_image(None)
+        self.card_back = ImageTk.PhotoImage(pil) if pil is not None else None
+
+    def _get_pil_image(self, card):
+        pil = self._pil_images.get(card)
+        if pil is None:
+            future = self._image_futures.pop(card, None)
+            if future is not None:
+                pil = Image.open(io.BytesIO(future.result()))
+                self._pil_images[card] = pil
+        return pil
+
+    def _get_card_image(self, card, width=None):
+        """Return the PhotoImage for a card, building it on first use.
+
+        Non-native widths resize the cached PIL image with LANCZOS - a
+        C-level resampler, far cheaper than re-rasterizing the SVG - and
+        memoize the PhotoImage per (card, width).
+        """
+        if width is None or width == CARD_WIDTH:
+            image = self.card_images[card]
+            if image is None:
+                pil = self._get_pil_image(card)
+                if pil is not None:
+                    image = ImageTk.PhotoImage(pil)
+                    self.card_images[card] = image
+            return image
+
+        key = (card, width)
+        image = self._sized_photos.get(key)
+        if image is None:
+            pil = self._get_pil_image(card)
+            if pil is not None:
+                size = (width, int(width * 1.4))
+                image = ImageTk.PhotoImage(pil.resize(size, Image.LANCZOS))
+                self._sized_photos[key] = image
+        return image
 
     def setup_gui(self):
         # Create main container frames with updated style
@@ -271,114 +385,163 @@ class GameWindow:
             self.notification_label.config(text="Computer checks")
         self.update_display()
 
-    def create_card_label(self, card, face_up=True):
-        """Creates a card label directly on root window"""
-        if face_up:
-            image = self.card_images.get(card)
-        else:
-            image = self.card_back
-            
-        label = ttk.Label(self.root, image=image, style='Custom.TLabel')
-        label.image = image  # Keep a reference!
-        return label
-
     def initialize_card_labels(self):
-        """Create and cache card labels for all possible positions"""
+        """Create and cache card labels for all possible positions
+
+        Plain tk.Label, not ttk - the card slots carry no themed styling
+        and the classic widget skips the style-engine Tcl round-trips.
+        """
         # Create 2 labels each for player and computer hands
         for _ in range(2):
-            player_label = ttk.Label(self.player_frame)
-            computer_label = ttk.Label(self.computer_frame)
+            player_label = tk.Label(self.player_frame, bd=0, bg=POKER_TABLE_GREEN)
+            computer_label = tk.Label(self.computer_frame, bd=0, bg=POKER_TABLE_GREEN)
             self.player_card_labels.append(player_label)
             self.computer_card_labels.append(computer_label)
-        
+
         # Create 5 labels for community cards
         for _ in range(5):
-            community_label = ttk.Label(self.community_frame)
+            community_label = tk.Label(self.community_frame, bd=0, bg=POKER_TABLE_GREEN)
             self.community_card_labels.append(community_label)
 
     def update_display(self):
-        print(f"Player hand: {self.game.player_hand}")
-        print(f"Community cards: {self.game.community_cards}")
-        print(f"Available card images: {len(self.card_images)}")
-        
-        # Get layout metrics
-        card_width = CARD_WIDTH
-        spacing = int(card_width * 0.5)
+        logger.debug("Player hand: %s", self.game.player_hand)
+        logger.debug("Community cards: %s", self.game.community_cards)
+        logger.debug("Loaded card images: %s", sum(image is not None for image in self.card_images))
         
+        # Slot positions come precomputed from calculate_layout
+        positions = self.layout['positions']
+        width = self.layout['width']
+
         # Update player cards
+        player_state = (width, tuple(self.game.player_hand))
+        if self._display_state.get('player') != player_state:
+            self._display_state['player'] = player_state
+            self.update_player_cards(positions['player'])
+
+        # Update computer cards
+        face_up = self.game.game_phase == GamePhase.RESULT
+        computer_state = (width, tuple(self.game.computer_hand), face_up)
+        if self._display_state.get('computer') != computer_state:
+            self._display_state['computer'] = computer_state
+            self.update_computer_cards(positions['computer'], face_up)
+
+        # Update community cards
+        community_state = (self.game.game_phase == GamePhase.PREFLOP, tuple(self.game.community_cards))
+        if self._display_state.get('community') != community_state:
+            self._display_state['community'] = community_state
+            self.update_community_cards(positions['community'])
+
+        # Update text labels
+        self.pot_label.configure(text=f"Pot: ${self.game.pot}")
+        self.chips_label.configure(text=f"Your Chips: ${self.game.player_chips}")
+
+    def update_player_cards(self, positions):
         for i, label in enumerate(self.player_card_labels):
             if i < len(self.game.player_hand):
                 card = self.game.player_hand[i]
-                image = self.card_images.get(card)
+                image = self._get_card_image(card)
                 if image:  # Add this check
-                    print(f"Placing player card {i} with image")  # Debug
+                    logger.debug("Placing player card %s", i)
+                    # card_images/card_back own the PhotoImage refs
                     label.configure(image=image)
-                    label.image = image  # Keep reference
-                    # Calculate position relative to player_frame
-                    x_pos = (self.player_frame.winfo_width() - (2 * card_width + spacing)) // 2 + i * (card_width + spacing)
-                    label.place(x=x_pos, y=0)
+                    label.place(x=positions[i], y=0)
                 else:
-                    print(f"No image found for player card {card}")  # Debug
+                    logger.warning("No image found for player card %s", card)
             else:
                 label.place_forget()
-        
-        # Update computer cards
-        face_up = self.game.game_phase == GamePhase.RESULT
+
+    def update_computer_cards(self, positions, face_up):
         for i, label in enumerate(self.computer_card_labels):
             if i < len(self.game.computer_hand):
                 card = self.game.computer_hand[i]
-                image = self.card_images.get(card) if face_up else self.card_back
+                image = self._get_card_image(card) if face_up else self.card_back
                 if image:  # Add this check
-                    print(f"Placing computer card {i} with image")  # Debug
+                    logger.debug("Placing computer card %s", i)
                     label.configure(image=image)
-                    label.image = image
-                    x_pos = (self.computer_frame.winfo_width() - (2 * card_width + spacing)) // 2 + i * (card_width + spacing)
-                    label.place(x=x_pos, y=0)
+                    label.place(x=positions[i], y=0)
                 else:
-                    print(f"No image found for computer card")  # Debug
+                    logger.warning("No image found for computer card")
             else:
                 label.place_forget()
-        
-        # Update community cards
+
+    def update_community_cards(self, positions):
         if self.game.game_phase == GamePhase.PREFLOP:
             for label in self.community_card_labels:
                 label.place_forget()
         else:
-            # Fixed left-aligned positioning
             for i, label in enumerate(self.community_card_labels):
                 if i < len(self.game.community_cards):
                     card = self.game.community_cards[i]
-                    image = self.card_images.get(card)
+                    image = self._get_card_image(card)
                     if image:
-                        print(f"Placing community card {i} with image")
+                        logger.debug("Placing community card %s", i)
                         label.configure(image=image)
-                        label.image = image
-                        # Calculate position from left edge with fixed spacing
-                        x_pos = i * (card_width + spacing)
-                        label.place(x=x_pos, y=0)
+                        label.place(x=positions[i], y=0)
                     else:
-                        print(f"No image found for community card {card}")
+                        logger.warning("No image found for community card %s", card)
                         label.place_forget()
                 else:
                     label.place_forget()
-        
-        # Update text labels
-        self.pot_label.configure(text=f"Pot: ${self.game.pot}")
-        self.chips_label.configure(text=f"Your Chips: ${self.game.player_chips}")
 
-    def calculate_layout(self):
-        """This method is no longer needed as positions are calculated in update_display"""
-        pass
+    def calculate_layout(self, width=None, height=None):
+        """Resolve the window size into cached layout metrics.
+
+        Callers with a size in hand (the resize path) pass it in; only the
+        initial call falls back to winfo_*, which forces a Tk geometry
+        flush and is worth avoiding during resize storms.
+        """
+        if width is None:
+            width = self.root.winfo_width()
+        if height is None:
+            height = self.root.winfo_height()
+
+        # Card frames are placed with relwidth=0.8, so the per-slot x
+        # offsets follow from the window width alone - no winfo queries
+        # in the redraw loops. Hole-card rows are centered; the community
+        # row is left-aligned.
+        frame_width = int(width * 0.8)
+        card_width = CARD_WIDTH
+        spacing = int(card_width * 0.5)
+        step = card_width + spacing
+        hole_base = (frame_width - (2 * card_width + spacing)) // 2
+        hole_positions = [hole_base + i * step for i in range(2)]
+        self.layout = {
+            'width': width,
+            'height': height,
+            'positions': {
+                'player': hole_positions,
+                'computer': hole_positions,
+                'community': [i * step for i in range(5)],
+            },
+        }
 
     def on_window_resize(self, event):
-        """Simplified resize handler"""
-        if event.widget == self.root and self.resize_timer is None:
-            self.resize_timer = self.root.after(100, self.delayed_resize)
+        """Size-filtered, trailing-edge debounced resize handler
+
+        Tk fires <Configure> for child-widget geometry changes too; only a
+        genuine root size change schedules a redraw. The event's size is
+        stashed so delayed_resize never has to ask Tk for it again.
+        """
+        if event.widget is not self.root:
+            return
+        size = (event.width, event.height)
+        # Compare against the size the pending timer would commit, not the
+        # last committed one - otherwise resizing away and back within the
+        # debounce window commits the stale intermediate size
+        current = self._pending_size if self.resize_timer is not None else self._last_size
+        if size == current:
+            return
+        self._pending_size = size
+        if self.resize_timer is not None:
+            self.root.after_cancel(self.resize_timer)
+        self.resize_timer = self.root.after(100, self.delayed_resize)
 
     def delayed_resize(self):
-        """Just update the display after resize"""
-        self.update_display()
+        """Redraw once the window size has settled"""
         self.resize_timer = None
+        self._last_size = self._pending_size
+        self.calculate_layout(*self._pending_size)
+        self.update_display()
 
     def setup_styles(self):
         style = ttk.Style()
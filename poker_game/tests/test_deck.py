@@ -1,20 +1,27 @@
 import pytest
 from poker_game.game.deck import Deck
-from poker_game.game.card import Card
 
 def test_deck_creation():
     deck = Deck()
-    assert len(deck.cards) == 52
+    assert deck.n_remaining == 52
 
 def test_deck_dealing():
     deck = Deck()
     card = deck.deal()
-    assert isinstance(card, Card)
-    assert len(deck.cards) == 51
+    assert isinstance(card, int)
+    assert deck.n_remaining == 51
 
 def test_deck_shuffle():
+    # Seeded, so the permutation is deterministic - no flake window
     deck1 = Deck()
-    deck2 = Deck()
+    deck2 = Deck(seed=0)
     deck2.shuffle()
-    # Note: There's a very small chance this could fail even with a proper shuffle
-    assert [str(card) for card in deck1.cards] != [str(card) for card in deck2.cards] 
\ No newline at end of file
+    assert list(deck2.cards) != list(deck1.cards)
+    assert sorted(deck2.cards) == sorted(deck1.cards)
+
+def test_deck_shuffle_reproducible():
+    deck1 = Deck(seed=7)
+    deck2 = Deck(seed=7)
+    deck1.shuffle()
+    deck2.shuffle()
+    assert list(deck1.cards) == list(deck2.cards)
\ No newline at end of file
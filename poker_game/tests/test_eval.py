@@ -0,0 +1,43 @@
+import random
+
+import numpy as np
+import pytest
+from poker_game.game.card import make_card, HEARTS, DIAMONDS, CLUBS, SPADES
+from poker_game.game.ck_eval import eval_best5
+from poker_game.game.seven_eval import evaluate7, evaluate7_batch
+from poker_game.game.hand_scorer import HandScore, STRAIGHT, FOUR_OF_A_KIND
+
+
+def hand(*spec):
+    return [make_card(rank, suit) for rank, suit in spec]
+
+
+def test_evaluate7_known_hands():
+    royal = hand((14, SPADES), (13, SPADES), (12, SPADES), (11, SPADES),
+                 (10, SPADES), (2, HEARTS), (3, CLUBS))
+    assert evaluate7(royal) == 1
+
+    wheel = hand((14, SPADES), (2, HEARTS), (3, CLUBS), (4, DIAMONDS),
+                 (5, HEARTS), (9, SPADES), (11, CLUBS))
+    assert HandScore(wheel).hand_type == STRAIGHT
+
+    quads = hand((8, HEARTS), (8, DIAMONDS), (8, CLUBS), (8, SPADES),
+                 (2, HEARTS), (3, CLUBS), (4, DIAMONDS))
+    assert HandScore(quads).hand_type == FOUR_OF_A_KIND
+
+
+def test_evaluate7_matches_best5():
+    random.seed(0)
+    deck = [make_card(rank, suit) for suit in range(4) for rank in range(2, 15)]
+    for _ in range(500):
+        cards = random.sample(deck, 7)
+        assert evaluate7(cards) == eval_best5(cards)
+
+
+def test_evaluate7_batch_matches_scalar():
+    random.seed(1)
+    deck = [make_card(rank, suit) for suit in range(4) for rank in range(2, 15)]
+    hands = [random.sample(deck, 7) for _ in range(500)]
+    batch = evaluate7_batch(np.array(hands, dtype=np.int8))
+    for cards, rank in zip(hands, batch):
+        assert evaluate7(cards) == rank
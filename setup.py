@@ -1,13 +1,59 @@
+import os
+import sys
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+
+class build_py_with_assets(build_py):
+    """Pre-rasterize the SVG card assets to PNG during the build.
+
+    Best-effort: if cairosvg (or its libcairo) is unavailable at build
+    time, the GUI simply rasterizes at first launch as before.
+    """
+
+    def run(self):
+        try:
+            sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tools'))
+            from rasterize_assets import rasterize_all
+            rasterize_all()
+        except Exception as exc:
+            print(f"skipping asset pre-rasterization: {exc}")
+        finally:
+            sys.path.pop(0)
+        super().run()
+
+# Compile the hot evaluator modules with mypyc when it is available; the
+# pure-Python modules are used as-is otherwise. hand_scorer itself stays
+# interpreted - its enum subclassing isn't mypyc-friendly and its hot path
+# is just a call into the compiled lookups anyway.
+try:
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        'poker_game/game/ck_eval.py',
+        'poker_game/game/seven_eval.py',
+    ])
+except ImportError:
+    ext_modules = []
 
 setup(
     name="poker_game",
     version="0.1",
     packages=find_packages(),
+    package_data={
+        'poker_game': ['assets/*.svg', 'assets/png/*.png'],
+        'poker_game.game': ['tables/*.npy'],
+    },
+    include_package_data=True,
+    ext_modules=ext_modules,
+    cmdclass={'build_py': build_py_with_assets},
     install_requires=[
         'tk',
         'pillow',
         'numpy',
         'cairosvg',
     ],
-) 
\ No newline at end of file
+    extras_require={
+        'fast-svg': ['resvg-py'],
+    },
+)
@@ -0,0 +1,104 @@
+"""Generate the 7-card evaluator lookup tables shipped in poker_game/game/tables.
+
+Run from the repo root:
+
+    python tools/gen_ph_tables.py
+
+Two tables come out, both on the Cactus Kev 1..7462 scale (lower is better):
+
+* flush7.npy - uint16[8192], indexed by the 13-bit rank mask of a suit
+  holding 5+ cards; value is the rank of the best 5-card flush (or straight
+  flush) inside that mask. With 7 cards, a flush can't coexist with quads or
+  a full house, so the flush value is always the hand's final rank.
+
+* noflush7_keys.npy / noflush7_vals.npy - the 49205 possible 7-card rank
+  multisets (each rank count 0..4, counts summing to 7), keyed by
+  sum(count[r] * 5**r) and sorted by key. The value is the best 5-card rank
+  ignoring suits.
+
+The key is a perfect hash: rank counts never reach 5, so the base-5 digits
+never collide.
+"""
+import os
+from itertools import combinations
+
+import numpy as np
+
+from poker_game.game.ck_eval import _FLUSHES, _UNIQUE5, _PRODUCTS, PRIMES
+
+OUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'poker_game', 'game', 'tables')
+
+
+def eval5_ranks(ranks):
+    """Rank 5 rank-indices (0..12) ignoring suits."""
+    bitmap = 0
+    for r in ranks:
+        bitmap |= 1 << r
+    rank = _UNIQUE5.get(bitmap)
+    if rank is not None:
+        return rank
+    product = 1
+    for r in ranks:
+        product *= PRIMES[r]
+    return _PRODUCTS[product]
+
+
+def best5_of_7_ranks(ranks):
+    return min(eval5_ranks(combo) for combo in set(combinations(sorted(ranks), 5)))
+
+
+def build_flush_table():
+    table = np.zeros(1 << 13, dtype=np.uint16)
+    for n_bits in (5, 6, 7):
+        for bits in combinations(range(13), n_bits):
+            mask = sum(1 << b for b in bits)
+            table[mask] = min(
+                _FLUSHES[sum(1 << b for b in combo)]
+                for combo in combinations(bits, 5)
+            )
+    return table
+
+
+def iter_count_vectors(n_ranks=13, total=7, max_count=4):
+    """Yield all rank-count vectors for a 7-card hand."""
+    def rec(idx, remaining, counts):
+        if idx == n_ranks - 1:
+            if remaining <= max_count:
+                counts[idx] = remaining
+                yield tuple(counts)
+            return
+        for c in range(min(max_count, remaining) + 1):
+            counts[idx] = c
+            yield from rec(idx + 1, remaining - c, counts)
+
+    yield from rec(0, total, [0] * n_ranks)
+
+
+def build_noflush_table():
+    keys = []
+    vals = []
+    for counts in iter_count_vectors():
+        ranks = [r for r in range(13) for _ in range(counts[r])]
+        key = sum(counts[r] * 5 ** r for r in range(13))
+        keys.append(key)
+        vals.append(best5_of_7_ranks(ranks))
+    order = np.argsort(np.array(keys, dtype=np.uint32))
+    return (np.array(keys, dtype=np.uint32)[order],
+            np.array(vals, dtype=np.uint16)[order])
+
+
+def main():
+    os.makedirs(OUT_DIR, exist_ok=True)
+    flush_table = build_flush_table()
+    np.save(os.path.join(OUT_DIR, 'flush7.npy'), flush_table)
+    keys, vals = build_noflush_table()
+    assert len(keys) == 49205, len(keys)
+    np.save(os.path.join(OUT_DIR, 'noflush7_keys.npy'), keys)
+    np.save(os.path.join(OUT_DIR, 'noflush7_vals.npy'), vals)
+    print(f"wrote tables to {os.path.abspath(OUT_DIR)}: "
+          f"flush7 {flush_table.nbytes} bytes, "
+          f"noflush7 {keys.nbytes + vals.nbytes} bytes ({len(keys)} entries)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Pre-rasterize the SVG card assets to PNG at the shipped card width.
+
+Run from the repo root:
+
+    python tools/rasterize_assets.py [width ...]
+
+Writes poker_game/assets/png/{name}_{width}.png for every SVG in
+poker_game/assets, at CARD_WIDTH by default. GameWindow.rasterize_image
+picks these up before falling back to cairosvg, so installs that ran this
+step never pay SVG rasterization at launch. setup.py invokes it during
+build_py when cairosvg is importable.
+"""
+import os
+import sys
+
+from cairosvg import svg2png
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), '..', 'poker_game', 'assets')
+CARD_WIDTH = 175  # keep in sync with poker_game.gui.game_window.CARD_WIDTH
+ASPECT_RATIO = 1.4
+
+
+def rasterize_all(widths=(CARD_WIDTH,)):
+    out_dir = os.path.join(ASSETS_DIR, 'png')
+    os.makedirs(out_dir, exist_ok=True)
+    written = 0
+    for entry in sorted(os.listdir(ASSETS_DIR)):
+        if not entry.endswith('.svg'):
+            continue
+        stem = entry[:-4]
+        svg_path = os.path.join(ASSETS_DIR, entry)
+        for width in widths:
+            out_path = os.path.join(out_dir, f'{stem}_{width}.png')
+            if (os.path.exists(out_path)
+                    and os.path.getmtime(out_path) >= os.path.getmtime(svg_path)):
+                continue
+            svg2png(url=svg_path, output_width=width,
+                    output_height=int(width * ASPECT_RATIO), write_to=out_path)
+            written += 1
+    return written
+
+
+if __name__ == '__main__':
+    widths = tuple(int(arg) for arg in sys.argv[1:]) or (CARD_WIDTH,)
+    print(f"rasterized {rasterize_all(widths)} PNGs into {os.path.join(ASSETS_DIR, 'png')}")